@@ -28,11 +28,13 @@ app.use(cors({
 }));
 app.use(express.json());
 
-// Initialize database tables
+// Initialize database tables. One routine on one pooled connection instead
+// of separate per-table init calls each checking out their own client
 async function initializeDatabase() {
+  const client = await pool.connect();
   try {
     // Create users table if it doesn't exist
-    await pool.query(`
+    await client.query(`
       CREATE TABLE IF NOT EXISTS users (
         id SERIAL PRIMARY KEY,
         email VARCHAR(255) UNIQUE NOT NULL,
@@ -45,9 +47,28 @@ async function initializeDatabase() {
         is_active BOOLEAN DEFAULT true
       )
     `);
+
+    // Create token blacklist table if it doesn't exist
+    await client.query(`
+      CREATE TABLE IF NOT EXISTS token_blacklist (
+        id SERIAL PRIMARY KEY,
+        token TEXT NOT NULL,
+        expires_at TIMESTAMP NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+      )
+    `);
+    // Every authenticated request checks the blacklist; without this index
+    // that lookup is a sequential scan over the whole table
+    await client.query(`
+      CREATE INDEX IF NOT EXISTS idx_token_blacklist_token
+      ON token_blacklist (token)
+    `);
+
     console.log('Database initialized successfully');
   } catch (error) {
     console.error('Error initializing database:', error);
+  } finally {
+    client.release();
   }
 }
 
@@ -194,26 +215,6 @@ app.post('/api/auth/register', async (req, res) => {
   }
 });
 
-// Initialize token blacklist table
-async function initializeBlacklistTable() {
-  try {
-    await pool.query(`
-      CREATE TABLE IF NOT EXISTS token_blacklist (
-        id SERIAL PRIMARY KEY,
-        token TEXT NOT NULL,
-        expires_at TIMESTAMP NOT NULL,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-      )
-    `);
-    console.log('Token blacklist table initialized successfully');
-  } catch (error) {
-    console.error('Error initializing token blacklist table:', error);
-  }
-}
-
-// Initialize blacklist table when server starts
-initializeBlacklistTable();
-
 // POST /api/auth/logout
 app.post('/api/auth/logout', async (req, res) => {
   try {
@@ -317,16 +318,6 @@ app.get('/api/debug/users', async (req, res) => {
   }
 });
 
-// Debug endpoint to check user data (REMOVE IN PRODUCTION)
-app.get('/api/debug/users', async (req, res) => {
-  try {
-    const result = await pool.query('SELECT id, email, password_hash FROM users');
-    res.json({ users: result.rows });
-  } catch (error) {
-    res.status(500).json({ error: error.message });
-  }
-});
-
 // Health check endpoint with database test
 app.get('/api/health', async (req, res) => {
   try {
@@ -1,4 +1,4 @@
-import React, { useState, useRef, useEffect } from "react";
+import React, { useState, useRef, useEffect, useMemo } from "react";
 import { ChevronDown, FileText, FileType } from "./ui/Icons";
 
 interface DropdownOption {
@@ -9,6 +9,27 @@ interface DropdownOption {
   iconColor?: string;
 }
 
+// Icon elements are immutable, so build them once at module load instead of
+// re-running a switch and allocating a new element per option row per render
+const FILE_ICONS: Record<string, React.ReactElement> = {
+  pdf: <FileType className="h-5 w-5 text-red-600 shrink-0" />,
+  word: <FileText className="h-5 w-5 text-blue-600 shrink-0" />,
+  excel: <FileText className="h-5 w-5 text-green-600 shrink-0" />,
+  powerpoint: <FileText className="h-5 w-5 text-orange-500 shrink-0" />,
+  text: <FileText className="h-5 w-5 text-gray-600 shrink-0" />,
+  opendoc: <FileText className="h-5 w-5 text-purple-600 shrink-0" />,
+  web: <FileText className="h-5 w-5 text-indigo-600 shrink-0" />,
+  image: <FileText className="h-5 w-5 text-pink-500 shrink-0" />,
+};
+
+const NO_SELECTION_ICON = <FileType className="h-5 w-5 text-lks-navy shrink-0" />;
+const DEFAULT_FILE_ICON = <FileType className="h-5 w-5 text-gray-700 shrink-0" />;
+
+const getFileIcon = (optionId?: string) => {
+  if (!optionId) return NO_SELECTION_ICON;
+  return FILE_ICONS[optionId] || DEFAULT_FILE_ICON;
+};
+
 interface CustomDropdownProps {
   options: DropdownOption[];
   value: string;
@@ -29,13 +50,27 @@ const CustomDropdown: React.FC<CustomDropdownProps> = ({
   const wrapperRef = useRef<HTMLDivElement>(null);
 
   const selectedOption = options.find((o) => o.id === value);
-  
-  // Filter options based on search term
-  const filteredOptions = options.filter(option => 
-    option.label.toLowerCase().includes(searchTerm.toLowerCase()) ||
-    option.id.toLowerCase().includes(searchTerm.toLowerCase())
+
+  // Lowercase each option once when the list changes instead of twice per
+  // option on every keystroke
+  const searchIndex = useMemo(
+    () => options.map(option => ({
+      option,
+      label: option.label.toLowerCase(),
+      id: option.id.toLowerCase()
+    })),
+    [options]
   );
 
+  // Filter options based on search term; with no term every entry matches,
+  // so skip the scan (the common case - the dropdown opens with an empty box)
+  const term = searchTerm.toLowerCase();
+  const filteredOptions = term === ''
+    ? options
+    : searchIndex
+        .filter(entry => entry.label.includes(term) || entry.id.includes(term))
+        .map(entry => entry.option);
+
   // Close on outside click
   useEffect(() => {
     const handler = (e: MouseEvent) => {
@@ -47,31 +82,6 @@ const CustomDropdown: React.FC<CustomDropdownProps> = ({
     return () => document.removeEventListener("mousedown", handler);
   }, []);
 
-  const getFileIcon = (optionId?: string) => {
-    if (!optionId) return <FileType className="h-5 w-5 text-lks-navy shrink-0" />;
-    
-    switch(optionId) {
-      case 'pdf':
-        return <FileType className="h-5 w-5 text-red-600 shrink-0" />;
-      case 'word':
-        return <FileText className="h-5 w-5 text-blue-600 shrink-0" />;
-      case 'excel':
-        return <FileText className="h-5 w-5 text-green-600 shrink-0" />;
-      case 'powerpoint':
-        return <FileText className="h-5 w-5 text-orange-500 shrink-0" />;
-      case 'text':
-        return <FileText className="h-5 w-5 text-gray-600 shrink-0" />;
-      case 'opendoc':
-        return <FileText className="h-5 w-5 text-purple-600 shrink-0" />;
-      case 'web':
-        return <FileText className="h-5 w-5 text-indigo-600 shrink-0" />;
-      case 'image':
-        return <FileText className="h-5 w-5 text-pink-500 shrink-0" />;
-      default:
-        return <FileType className="h-5 w-5 text-gray-700 shrink-0" />;
-    }
-  };
-
   // Check if this is a language dropdown (has icon as string code)
   const isLanguageDropdown = options.some(opt => typeof opt.icon === 'string' && opt.icon !== null);
 
@@ -2,6 +2,25 @@ import React, { useCallback, useState } from 'react';
 import { UploadCloud, FileText, X, AlertCircle, CheckCircle2 } from './ui/Icons';
 import { DocumentTypeOption } from '../types';
 
+// Accepted extensions and legal filename keywords, built once at module load
+// instead of per validation call
+const LEGAL_EXTENSIONS = new Set([
+  '.pdf', '.doc', '.docx', '.txt', '.rtf', '.odt', '.xls', '.xlsx', '.csv',
+  '.ppt', '.pptx', '.html', '.xml', '.json'
+]);
+
+// One case-insensitive test instead of lowercasing the filename twice
+const EXCEL_FILE_RE = /\.xlsx?$/i;
+
+const LEGAL_KEYWORDS = [
+  'contract', 'agreement', 'legal', 'brief', 'court', 'motion', 'petition', 'complaint',
+  'order', 'judgment', 'decision', 'ruling', 'settlement', 'discovery', 'subpoena',
+  'deposition', 'affidavit', 'declaration', 'notice', 'demand', 'disclosure',
+  'certificate', 'license', 'permit', 'bond', 'lien', 'mortgage', 'deed', 'will',
+  'trust', 'estate', 'probate', 'litigation', 'arbitration', 'mediation', 'compliance',
+  'regulatory', 'bylaws', 'charter', 'resolution', 'minutes', 'partnership', 'operating'
+];
+
 interface FileUploadProps {
   onFileSelect: (file: File) => void;
   onFileRemove: () => void;
@@ -64,28 +83,21 @@ const FileUpload: React.FC<FileUploadProps> = ({
   // Function to validate legal documents
   const isValidLegalDocument = (file: File): boolean => {
     const fileName = file.name.toLowerCase();
-    const fileType = file.type.toLowerCase();
-    
-    // Check file extension
-    const legalExtensions = ['.pdf', '.doc', '.docx', '.txt', '.rtf', '.odt', '.xls', '.xlsx', '.csv', '.ppt', '.pptx', '.html', '.xml', '.json'];
-    
-    // Check if file has legal extension
-    const hasValidExtension = legalExtensions.some(ext => fileName.endsWith(ext));
-    
-    // Check if file name suggests legal content
-    const legalKeywords = [
-      'contract', 'agreement', 'legal', 'brief', 'court', 'motion', 'petition', 'complaint',
-      'order', 'judgment', 'decision', 'ruling', 'settlement', 'discovery', 'subpoena',
-      'deposition', 'affidavit', 'declaration', 'notice', 'demand', 'disclosure',
-      'certificate', 'license', 'permit', 'bond', 'lien', 'mortgage', 'deed', 'will',
-      'trust', 'estate', 'probate', 'litigation', 'arbitration', 'mediation', 'compliance',
-      'regulatory', 'bylaws', 'charter', 'resolution', 'minutes', 'partnership', 'operating'
-    ];
-    
-    const containsLegalKeyword = legalKeywords.some(keyword => fileName.includes(keyword));
-    
-    // For now, we'll accept any file with a valid extension, but prioritize files with legal keywords
-    return hasValidExtension && (containsLegalKeyword || selectedDocType?.id !== 'text'); // Be stricter for text files
+
+    // Cheapest check first: one set lookup on the extension
+    const dotIndex = fileName.lastIndexOf('.');
+    if (dotIndex < 0 || !LEGAL_EXTENSIONS.has(fileName.slice(dotIndex))) {
+      return false;
+    }
+
+    // For now, we accept any file with a valid extension; the keyword scan
+    // only decides the outcome for text files, so skip it otherwise
+    if (selectedDocType?.id !== 'text') {
+      return true;
+    }
+
+    // Be stricter for text files: the name must suggest legal content
+    return LEGAL_KEYWORDS.some(keyword => fileName.includes(keyword));
   };
 
   const formatFileSize = (bytes: number) => {
@@ -215,7 +227,7 @@ const FileUpload: React.FC<FileUploadProps> = ({
               </div>
                         
               {/* Warning message for Excel files */}
-              {selectedFile.name.toLowerCase().endsWith('.xls') || selectedFile.name.toLowerCase().endsWith('.xlsx') ? (
+              {EXCEL_FILE_RE.test(selectedFile.name) ? (
                 <div className="mt-2 text-xs text-amber-700 bg-amber-50 border border-amber-200 rounded px-3 py-2 flex items-start">
                   <AlertCircle size={14} className="mr-2 mt-0.5 flex-shrink-0" />
                   <span>For best results, use PDF/DOC or other text-based formats instead of Excel files.</span>
@@ -1,10 +1,13 @@
 import React, { useState } from 'react';
 import { CheckCircle2, AlertCircle, Loader2, Download, ArrowRight, FileText, Languages, ShieldCheck } from './ui/Icons';
 import { ProcessingStatus, TranslationState } from '../types';
-import { DOCUMENT_TYPES, LANGUAGES } from '../constants';
+import { DOCUMENT_TYPES, LANGUAGE_NAME_BY_CODE } from '../constants';
 
 import TranslationService from '../services/TranslationService';
 
+// Extensions the translator converts to .docx, built once at module load
+const IMAGE_EXTENSIONS = new Set(['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp']);
+
 interface StatusFeedbackProps {
   state: TranslationState;
   onReset: () => void;
@@ -31,10 +34,10 @@ const StatusFeedback: React.FC<StatusFeedbackProps> = ({ state, onReset, onViewH
       // PDFs and images generate Word documents, so use .docx
       let ext = originalExt;
       const docTypeLower = (docType || '').toLowerCase();
-      if (docTypeLower === 'pdf' || 
-          docTypeLower === 'image' || 
+      if (docTypeLower === 'pdf' ||
+          docTypeLower === 'image' ||
           originalExt === '.pdf' ||
-          ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp'].includes(originalExt)) {
+          IMAGE_EXTENSIONS.has(originalExt)) {
         ext = '.docx';
       }
       
@@ -53,8 +56,8 @@ const StatusFeedback: React.FC<StatusFeedbackProps> = ({ state, onReset, onViewH
 
   if (status === 'idle') return null;
 
-  const sourceLangName = LANGUAGES.find(l => l.code === sourceLang)?.name || sourceLang;
-  const targetLangName = LANGUAGES.find(l => l.code === targetLang)?.name || targetLang;
+  const sourceLangName = LANGUAGE_NAME_BY_CODE.get(sourceLang) || sourceLang;
+  const targetLangName = LANGUAGE_NAME_BY_CODE.get(targetLang) || targetLang;
 
   return (
     <div className="mt-8 animate-fade-in">
@@ -6,10 +6,34 @@ import StatusFeedback from './StatusFeedback';
 import CustomDropdown from './CustomDropdown';
   
 import TranslationService from '../services/TranslationService'; 
-import { DOCUMENT_TYPES, LANGUAGES } from '../constants';
+import { DOCUMENT_TYPES, DOCUMENT_TYPE_BY_ID, LANGUAGES } from '../constants';
 import { TranslationState, DocumentType } from '../types';
 import { ArrowRight, CheckCircle2, ShieldCheck, Languages as LangIcon } from './ui/Icons';
 
+// Dropdown option lists are pure functions of the static constants, so build
+// them once at module load instead of re-mapping ~100 entries every render.
+// Stable references also let CustomDropdown's memoized search index hold.
+const DOC_TYPE_OPTIONS = DOCUMENT_TYPES.map(type => ({
+  id: type.id,
+  label: type.label.split(' (')[0],
+  extensions: type.extensions,
+  icon: null
+}));
+
+const SOURCE_LANGUAGE_OPTIONS = LANGUAGES.map(lang => ({
+  id: lang.code,
+  label: lang.name,
+  extensions: [],
+  icon: lang.code === 'auto' ? null : lang.code.split('-')[0].toUpperCase()
+}));
+
+const TARGET_LANGUAGE_OPTIONS = LANGUAGES.filter(l => l.code !== 'auto').map(lang => ({
+  id: lang.code,
+  label: lang.name,
+  extensions: [],
+  icon: lang.code.split('-')[0].toUpperCase()
+}));
+
 const TranslatorApp: React.FC = () => {
   const [state, setState] = useState<TranslationState>({
     docType: '',
@@ -23,9 +47,9 @@ const TranslatorApp: React.FC = () => {
 
   const [showHistoryModal, setShowHistoryModal] = useState(false);
 
-  const handleDocTypeChange = (e: React.ChangeEvent<HTMLSelectElement>) => {
-    const newType = e.target.value as DocumentType;
-    setState(prev => ({ 
+  const handleDocTypeChange = (value: string) => {
+    const newType = value as DocumentType;
+    setState(prev => ({
       ...prev, 
       docType: newType, 
       file: null, 
@@ -117,51 +141,64 @@ const TranslatorApp: React.FC = () => {
   }
 };
 
-  const selectedDocTypeOption = DOCUMENT_TYPES.find(d => d.id === state.docType) || null;
+  const selectedDocTypeOption = DOCUMENT_TYPE_BY_ID.get(state.docType) || null;
   const isReadyToTranslate = state.docType && state.sourceLang && state.targetLang && state.file;
   const isProcessingOrComplete = state.status !== 'idle';
 
-  // Poll for status when processing
+  // Poll for status when processing. Each response is applied as soon as it
+  // arrives and the next request is only scheduled after the previous one
+  // completes, so a slow backend never has overlapping polls in flight.
   React.useEffect(() => {
-    let pollInterval: NodeJS.Timeout;
-
-    if (state.status === 'processing' && state.jobId) {
-      pollInterval = setInterval(async () => {
-        try {
-          const statusResponse = await TranslationService.getTranslationStatus(state.jobId!);
-          console.log('[TranslatorApp] Poll status:', statusResponse);
-
-          if (statusResponse.status === 'completed') {
-            setState(prev => ({
-              ...prev,
-              status: 'completed',
-              progress: 100,
-              translatedFileUrl: statusResponse.translatedFileUrl
-            }));
-            clearInterval(pollInterval);
-          } else if (statusResponse.status === 'failed') {
-            setState(prev => ({
-              ...prev,
-              status: 'error',
-              errorMessage: statusResponse.error || 'Translation failed during processing'
-            }));
-            clearInterval(pollInterval);
-          } else {
-             // Update progress if available
-             setState(prev => ({
-               ...prev,
-               progress: statusResponse.progress || prev.progress
-             }));
-          }
-        } catch (error) {
-          console.error('Error polling status:', error);
-          // Don't fail immediately on poll error, might be transient
+    if (state.status !== 'processing' || !state.jobId) return;
+
+    let cancelled = false;
+    let timer: ReturnType<typeof setTimeout>;
+
+    const poll = async () => {
+      try {
+        const statusResponse = await TranslationService.getTranslationStatus(state.jobId!);
+        if (cancelled) return;
+        console.log('[TranslatorApp] Poll status:', statusResponse);
+
+        if (statusResponse.status === 'completed') {
+          setState(prev => ({
+            ...prev,
+            status: 'completed',
+            progress: 100,
+            translatedFileUrl: statusResponse.translatedFileUrl
+          }));
+          return;
         }
-      }, 2000); // Poll every 2 seconds
-    }
+
+        if (statusResponse.status === 'failed') {
+          setState(prev => ({
+            ...prev,
+            status: 'error',
+            errorMessage: statusResponse.error || 'Translation failed during processing'
+          }));
+          return;
+        }
+
+        // Update progress if available
+        setState(prev => ({
+          ...prev,
+          progress: statusResponse.progress || prev.progress
+        }));
+      } catch (error) {
+        console.error('Error polling status:', error);
+        // Don't fail immediately on poll error, might be transient
+      }
+
+      if (!cancelled) {
+        timer = setTimeout(poll, 2000); // Poll every 2 seconds
+      }
+    };
+
+    timer = setTimeout(poll, 2000);
 
     return () => {
-      if (pollInterval) clearInterval(pollInterval);
+      cancelled = true;
+      clearTimeout(timer);
     };
   }, [state.status, state.jobId]);
 
@@ -229,17 +266,9 @@ const TranslatorApp: React.FC = () => {
                   </div>
                   <div className="p-8">
                     <CustomDropdown
-                      options={DOCUMENT_TYPES.map(type => ({
-                        id: type.id,
-                        label: type.label.split(' (')[0],
-                        extensions: type.extensions,
-                        icon: null
-                      }))}
+                      options={DOC_TYPE_OPTIONS}
                       value={state.docType}
-                      onChange={(value) => {
-                        const event = { target: { value } } as React.ChangeEvent<HTMLSelectElement>;
-                        handleDocTypeChange(event);
-                      }}
+                      onChange={handleDocTypeChange}
                       placeholder="Select document format..."
                       label="Document Type"
                     />
@@ -263,12 +292,7 @@ const TranslatorApp: React.FC = () => {
                            <span>Source Language</span>
                          </div>
                          <CustomDropdown
-                           options={LANGUAGES.map(lang => ({
-                             id: lang.code,
-                             label: lang.name,
-                             extensions: [],
-                             icon: lang.code === 'auto' ? null : lang.code.split('-')[0].toUpperCase()
-                           }))}
+                           options={SOURCE_LANGUAGE_OPTIONS}
                            value={state.sourceLang}
                            onChange={(value) => setState(prev => ({...prev, sourceLang: value}))}
                            placeholder="From Language..."
@@ -282,12 +306,7 @@ const TranslatorApp: React.FC = () => {
                            <span>Target Language</span>
                          </div>
                          <CustomDropdown
-                           options={LANGUAGES.filter(l => l.code !== 'auto').map(lang => ({
-                             id: lang.code,
-                             label: lang.name,
-                             extensions: [],
-                             icon: lang.code.split('-')[0].toUpperCase()
-                           }))}
+                           options={TARGET_LANGUAGE_OPTIONS}
                            value={state.targetLang}
                            onChange={(value) => setState(prev => ({...prev, targetLang: value}))}
                            placeholder="To Language..."
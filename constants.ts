@@ -115,6 +115,16 @@ export const LANGUAGES: LanguageOption[] = [
   { code: 'zu', name: 'Zulu' },
 ];
 
+// Constant-time name lookups - LANGUAGES.find is a linear scan over ~100
+// entries, which adds up when done per render
+export const LANGUAGE_NAME_BY_CODE: ReadonlyMap<string, string> = new Map(
+  LANGUAGES.map(lang => [lang.code, lang.name])
+);
+
+export const DOCUMENT_TYPE_BY_ID: ReadonlyMap<string, DocumentTypeOption> = new Map(
+  DOCUMENT_TYPES.map(type => [type.id, type])
+);
+
 export const STEPS = [
   { id: 1, label: 'Type' },
   { id: 2, label: 'Languages' },
@@ -31,12 +31,16 @@ export const AuthProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
     setState(prev => ({ ...prev, isLoading: true }));
 
     try {
-      const decoded = await RenderAuthService.verifyToken();
+      // Verify the token and fetch the profile concurrently - both are
+      // independent round-trips to the auth service, so there is no need
+      // to pay two sequential network latencies on every app load
+      const [decoded, user] = await Promise.all([
+        RenderAuthService.verifyToken(),
+        RenderAuthService.getCurrentUser()
+      ]);
       console.log('[AuthContext] Decoded token:', decoded);
 
-      if (decoded) {
-        const user = await RenderAuthService.getCurrentUser();
-
+      if (decoded && user) {
         setState({
           user: user,
           isAuthenticated: true,
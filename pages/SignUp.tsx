@@ -5,6 +5,18 @@ import AuthLayout from '../components/auth/AuthLayout';
 import AuthInput from '../components/auth/AuthInput';
 import { Lock, Mail, User, ArrowRight, Check, X, Loader2 } from 'lucide-react';
 
+// Password requirements - static, so define them (and their regexes) once at
+// module load; they are re-tested on every keystroke in the password field
+const PASSWORD_REQUIREMENTS = [
+  { id: 'length', label: 'At least 12 characters', regex: /.{12,}/ },
+  { id: 'upper', label: 'Uppercase letter', regex: /[A-Z]/ },
+  { id: 'lower', label: 'Lowercase letter', regex: /[a-z]/ },
+  { id: 'number', label: 'Number', regex: /[0-9]/ },
+  { id: 'special', label: 'Special character', regex: /[^A-Za-z0-9]/ },
+];
+
+const EMAIL_RE = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+
 const SignUp: React.FC = () => {
   const navigate = useNavigate();
   const { register } = useAuth(); // Get register function from auth context
@@ -19,19 +31,10 @@ const SignUp: React.FC = () => {
   const [isLoading, setIsLoading] = useState(false);
   const [passwordStrength, setPasswordStrength] = useState(0);
 
-  // Password requirements
-  const requirements = [
-    { id: 'length', label: 'At least 12 characters', regex: /.{12,}/ },
-    { id: 'upper', label: 'Uppercase letter', regex: /[A-Z]/ },
-    { id: 'lower', label: 'Lowercase letter', regex: /[a-z]/ },
-    { id: 'number', label: 'Number', regex: /[0-9]/ },
-    { id: 'special', label: 'Special character', regex: /[^A-Za-z0-9]/ },
-  ];
-
   useEffect(() => {
     // Calculate password strength
-    const matches = requirements.filter(req => req.regex.test(formData.password)).length;
-    setPasswordStrength((matches / requirements.length) * 100);
+    const matches = PASSWORD_REQUIREMENTS.filter(req => req.regex.test(formData.password)).length;
+    setPasswordStrength((matches / PASSWORD_REQUIREMENTS.length) * 100);
   }, [formData.password]);
 
   const handleChange = (e: React.ChangeEvent<HTMLInputElement>) => {
@@ -51,7 +54,7 @@ const SignUp: React.FC = () => {
 
     if (!formData.email) {
       newErrors.email = 'Email is required';
-    } else if (!/^[^\s@]+@[^\s@]+\.[^\s@]+$/.test(formData.email)) {
+    } else if (!EMAIL_RE.test(formData.email)) {
       newErrors.email = 'Invalid email address';
     }
 
@@ -161,7 +164,7 @@ const SignUp: React.FC = () => {
               </div>
 
               <div className="grid grid-cols-1 gap-1 pt-1">
-                {requirements.map(req => {
+                {PASSWORD_REQUIREMENTS.map(req => {
                   const met = req.regex.test(formData.password);
                   return (
                     <div key={req.id} className="flex items-center gap-2 text-xs">
@@ -1,26 +1,23 @@
 // ApiServiceFactory.ts - Factory for routing API requests to appropriate services
 
+// Endpoint routing patterns, compiled once at module load so classification
+// is a single regex test per service instead of a chain of includes() scans
+const AUTH_ENDPOINT_RE = /\/auth\/|\/login|\/register|\/logout|\/verify|\/me/;
+const TRANSLATION_ENDPOINT_RE = /\/process-translation|\/jobs|\/download|\/translation/;
+
 export class ApiServiceFactory {
   // Determine which service to use based on the endpoint
   static getServiceForEndpoint(endpoint: string): 'auth' | 'translation' | 'other' {
     // Authentication endpoints
-    if (endpoint.includes('/auth/') || 
-        endpoint.includes('/login') || 
-        endpoint.includes('/register') || 
-        endpoint.includes('/logout') ||
-        endpoint.includes('/verify') ||
-        endpoint.includes('/me')) {
+    if (AUTH_ENDPOINT_RE.test(endpoint)) {
       return 'auth';
     }
-    
+
     // Translation endpoints
-    if (endpoint.includes('/process-translation') || 
-        endpoint.includes('/jobs') || 
-        endpoint.includes('/download') ||
-        endpoint.includes('/translation')) {
+    if (TRANSLATION_ENDPOINT_RE.test(endpoint)) {
       return 'translation';
     }
-    
+
     // All other endpoints go to company backend
     return 'other';
   }
@@ -53,9 +50,9 @@ export class ApiServiceFactory {
     }
   }
 
-  // Build full URL with proper base URL
-  static buildUrl(endpoint: string): string {
-    const serviceType = this.getServiceForEndpoint(endpoint);
+  // Build full URL with proper base URL. Callers that already classified
+  // the endpoint can pass the service type to avoid resolving it twice
+  static buildUrl(endpoint: string, serviceType: 'auth' | 'translation' | 'other' = this.getServiceForEndpoint(endpoint)): string {
     const baseUrl = this.getBaseUrl(serviceType);
     
     // Remove leading slash if present to avoid double slashes
@@ -81,7 +78,7 @@ export class ApiServiceFactory {
   // Enhanced fetch wrapper that automatically routes to correct service
   static async fetch(endpoint: string, options: RequestInit = {}, authToken?: string): Promise<Response> {
     const serviceType = this.getServiceForEndpoint(endpoint);
-    const fullUrl = this.buildUrl(endpoint);
+    const fullUrl = this.buildUrl(endpoint, serviceType);
     const headers = this.buildHeaders(serviceType, authToken);
 
     console.log(`[ApiServiceFactory] Routing ${options.method || 'GET'} request to ${serviceType} service:`, fullUrl);
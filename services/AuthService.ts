@@ -1,4 +1,5 @@
 import { User, LoginCredentials, RegisterData, JwtPayload } from '../types/auth';
+import { validatePassword } from './passwordRules';
 
 // Access environment variables
 const getEnvVar = (name: string, fallback: string): string => {
@@ -16,6 +17,10 @@ const TRANSLATION_API_KEY = 'tr_api_1234567890abcdefghijklmnopqrstuvwxyz';
 // const API_URL = getEnvVar('VITE_API_URL', 'https://lks-translation-backend.onrender.com');
 // const TRANSLATION_API_KEY = getEnvVar('VITE_TRANSLATION_API_KEY', 'tr_api_1234567890abcdefghijklmnopqrstuvwxyz');
 
+// Compiled once at module load; generateUserId runs on every login,
+// registration and token mint
+const USER_ID_SANITIZE_RE = /[^a-zA-Z0-9]/g;
+
 interface LoginResponse {
   user: User;
   token: string;
@@ -44,34 +49,9 @@ class AuthService {
     localStorage.removeItem('auth_token');
   }
 
-  // Validate password strength
+  // Validate password strength (shared rule table in passwordRules.ts)
   validatePassword(password: string): { isValid: boolean; errors: string[] } {
-    const errors: string[] = [];
-
-    if (password.length < 8) {
-      errors.push('Password must be at least 8 characters long');
-    }
-
-    if (!/[A-Z]/.test(password)) {
-      errors.push('Password must contain at least one uppercase letter');
-    }
-
-    if (!/[a-z]/.test(password)) {
-      errors.push('Password must contain at least one lowercase letter');
-    }
-
-    if (!/\d/.test(password)) {
-      errors.push('Password must contain at least one number');
-    }
-
-    if (!/[!@#$%^&*(),.?":{}|<>]/.test(password)) {
-      errors.push('Password must contain at least one special character');
-    }
-
-    return {
-      isValid: errors.length === 0,
-      errors
-    };
+    return validatePassword(password);
   }
 
   // Login user - Using translation service for authentication
@@ -250,8 +230,11 @@ Purpose: User Registration`;
   }
 
   // Generate user ID from email
+  // Deterministic: the same email always maps to the same id, so the id in
+  // the token payload matches the returned user object and stays stable
+  // across sessions (Date.now() made every call produce a different id)
   private generateUserId(email: string): string {
-    return `user_${email.replace(/[^a-zA-Z0-9]/g, '_')}_${Date.now()}`;
+    return `user_${email.replace(USER_ID_SANITIZE_RE, '_')}`;
   }
 
   // Parse JWT-like token
@@ -272,79 +255,47 @@ Purpose: User Registration`;
     }
   }
 
-  // Verify token and get user info
-  async verifyToken(): Promise<JwtPayload | null> {
+  // Parse the stored token and check expiration in one pass; clears the
+  // token when it is missing, malformed or expired
+  private getValidPayload(): JwtPayload | null {
     const token = this.getToken();
 
     if (!token) {
       return null;
     }
 
-    try {
-      // Parse token to get user info
-      const decoded = this.parseToken(token);
-      if (!decoded) {
-        this.removeToken();
-        return null;
-      }
-
-      // Check token expiration
-      if (decoded.exp < Date.now()) {
-        this.removeToken();
-        return null;
-      }
-
-      return {
-        userId: decoded.userId,
-        email: decoded.email,
-        role: decoded.role,
-        exp: decoded.exp,
-      };
-    } catch (error) {
-      console.error('Token verification failed:', error);
+    const decoded = this.parseToken(token);
+    if (!decoded || decoded.exp < Date.now()) {
       this.removeToken();
       return null;
     }
+
+    return decoded;
+  }
+
+  // Verify token and get user info
+  async verifyToken(): Promise<JwtPayload | null> {
+    return this.getValidPayload();
   }
 
   // Get current user
   async getCurrentUser(): Promise<User | null> {
-    const token = this.getToken();
-
-    if (!token) {
+    const decoded = this.getValidPayload();
+    if (!decoded) {
       return null;
     }
 
-    try {
-      // Parse token to get user info
-      const decoded = this.parseToken(token);
-      if (!decoded) {
-        this.removeToken();
-        return null;
-      }
-
-      // Check token expiration
-      if (decoded.exp < Date.now()) {
-        this.removeToken();
-        return null;
-      }
-
-      // Create user object from token data
-      return {
-        id: decoded.userId,
-        email: decoded.email,
-        name: decoded.email.split('@')[0],
-        password: '',
-        role: decoded.role as 'admin' | 'client',
-        organization: 'Lakshmi Sri',
-        createdAt: new Date(decoded.exp - 7 * 24 * 60 * 60 * 1000), // 7 days ago
-        lastLogin: new Date(),
-      };
-    } catch (error) {
-      console.error('Error fetching user:', error);
-      this.removeToken();
-      return null;
-    }
+    // Create user object from token data
+    return {
+      id: decoded.userId,
+      email: decoded.email,
+      name: decoded.email.split('@')[0],
+      password: '',
+      role: decoded.role as 'admin' | 'client',
+      organization: 'Lakshmi Sri',
+      createdAt: new Date(decoded.exp - 7 * 24 * 60 * 60 * 1000), // 7 days ago
+      lastLogin: new Date(),
+    };
   }
 
   // Logout user
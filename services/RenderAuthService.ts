@@ -1,4 +1,5 @@
 import { User, LoginCredentials, RegisterData, JwtPayload } from '../types/auth';
+import { validatePassword } from './passwordRules';
 
 // Access environment variables for Render authentication
 const getEnvVar = (name: string, fallback: string): string => {
@@ -11,6 +12,17 @@ const getEnvVar = (name: string, fallback: string): string => {
 const RENDER_AUTH_URL = getEnvVar('VITE_RENDER_AUTH_URL', 'https://lks-auth-service.onrender.com');
 const RENDER_AUTH_API_KEY = getEnvVar('VITE_RENDER_AUTH_API_KEY', '2e3d1c8119481fde55b9980a8dae37c0f43b06b13c6bef7da0a6e97aa3ff8927');
 
+// Short-lived profile cache keyed by the token it was fetched with, so
+// repeated auth checks within a tab don't each hit /api/auth/me
+const USER_CACHE_KEY = 'auth_user_cache';
+const USER_CACHE_TTL_MS = 60 * 1000;
+
+interface UserCacheEntry {
+  token: string;
+  timestamp: number;
+  user: User;
+}
+
 interface LoginResponse {
   user: User;
   token: string;
@@ -39,34 +51,9 @@ class RenderAuthService {
     localStorage.removeItem('auth_token');
   }
 
-  // Validate password strength
+  // Validate password strength (shared rule table in passwordRules.ts)
   validatePassword(password: string): { isValid: boolean; errors: string[] } {
-    const errors: string[] = [];
-
-    if (password.length < 8) {
-      errors.push('Password must be at least 8 characters long');
-    }
-
-    if (!/[A-Z]/.test(password)) {
-      errors.push('Password must contain at least one uppercase letter');
-    }
-
-    if (!/[a-z]/.test(password)) {
-      errors.push('Password must contain at least one lowercase letter');
-    }
-
-    if (!/\d/.test(password)) {
-      errors.push('Password must contain at least one number');
-    }
-
-    if (!/[!@#$%^&*(),.?":{}|<>]/.test(password)) {
-      errors.push('Password must contain at least one special character');
-    }
-
-    return {
-      isValid: errors.length === 0,
-      errors
-    };
+    return validatePassword(password);
   }
 
   // Login user
@@ -177,6 +164,39 @@ class RenderAuthService {
     } finally {
       // Always remove local token
       this.removeToken();
+      this.clearUserCache();
+    }
+  }
+
+  // Read the cached profile, if it is fresh and belongs to this token
+  private readUserCache(token: string): User | null {
+    try {
+      const raw = sessionStorage.getItem(USER_CACHE_KEY);
+      if (!raw) return null;
+      const entry: UserCacheEntry = JSON.parse(raw);
+      if (entry.token !== token || Date.now() - entry.timestamp > USER_CACHE_TTL_MS) {
+        return null;
+      }
+      return entry.user;
+    } catch {
+      return null;
+    }
+  }
+
+  private writeUserCache(token: string, user: User): void {
+    try {
+      const entry: UserCacheEntry = { token, timestamp: Date.now(), user };
+      sessionStorage.setItem(USER_CACHE_KEY, JSON.stringify(entry));
+    } catch {
+      // Cache is best-effort; ignore quota/availability errors
+    }
+  }
+
+  private clearUserCache(): void {
+    try {
+      sessionStorage.removeItem(USER_CACHE_KEY);
+    } catch {
+      // Ignore
     }
   }
 
@@ -187,6 +207,11 @@ class RenderAuthService {
       return null;
     }
 
+    const cached = this.readUserCache(token);
+    if (cached) {
+      return cached;
+    }
+
     try {
       const response = await fetch(`${RENDER_AUTH_URL}/api/auth/me`, {
         method: 'GET',
@@ -201,11 +226,13 @@ class RenderAuthService {
       }
 
       const data = await response.json();
+      this.writeUserCache(token, data.user);
       return data.user;
     } catch (error) {
       console.error('[RenderAuthService] Get current user error:', error);
       // Remove invalid token
       this.removeToken();
+      this.clearUserCache();
       return null;
     }
   }
@@ -266,8 +293,9 @@ class RenderAuthService {
   }
 
   // Generate user ID (for mock purposes)
+  // Deterministic so repeated calls for the same email agree
   private generateUserId(email: string): string {
-    return `user_${email.split('@')[0]}_${Date.now()}`;
+    return `user_${email.split('@')[0]}`;
   }
 
   // Generate JWT-like token (for mock purposes)
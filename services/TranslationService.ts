@@ -2,6 +2,26 @@
 
 const API_URL = import.meta.env.VITE_TRANSLATION_BACKEND_URL || 'http://20.20.20.205:5000';
 
+// Resolved once at module load; every request sends the identical header
+const API_KEY = import.meta.env.VITE_TRANSLATION_API_KEY || 'tr_api_1234567890abcdefghijklmnopqrstuvwxyz';
+const API_HEADERS = { 'X-API-Key': API_KEY };
+
+// Compiled once at module load instead of per download call
+const CONTENT_DISPOSITION_FILENAME_RE = /filename[^;=\n]*=((['"]).*?\2|[^;\n]*)/;
+const FILENAME_QUOTE_TRIM_RE = /^\s*['"]|['"]\s*$/g;
+
+// Translation history persists in localStorage so revisits render instantly
+// and a flaky backend doesn't wipe the history view
+const HISTORY_CACHE_KEY = 'translation_history_cache';
+const HISTORY_CACHE_TTL_MS = 30 * 1000;
+
+interface HistoryCacheEntry {
+  timestamp: number;
+  limit: number;
+  offset: number;
+  jobs: TranslationJob[];
+}
+
 interface TranslationRequest {
   documentType: string;
   sourceLanguage: string;
@@ -41,6 +61,31 @@ class TranslationService {
   //   return { Authorization: `Bearer ${token}` };
   // }
 
+  // Parse a backend response as JSON, surfacing non-JSON bodies (proxy error
+  // pages, HTML 502s) as readable errors instead of JSON.parse failures
+  private async parseJsonResponse(response: Response): Promise<any> {
+    const contentType = response.headers.get('content-type');
+    if (contentType && contentType.includes('application/json')) {
+      return response.json();
+    }
+    const text = await response.text();
+    console.error('[TranslationService] Non-JSON response:', text);
+    throw new Error(`Server returned ${response.status}: ${text.substring(0, 200)}`);
+  }
+
+  // Normalize a raw backend job payload into the shape the app consumes.
+  // The submit and status paths previously each did this inline, with
+  // diverging field fallbacks
+  private toTranslationResponse(raw: any, fallbackJobId?: string): TranslationResponse {
+    return {
+      jobId: raw.jobId || raw.id || fallbackJobId || '',
+      status: raw.status,
+      progress: raw.progress || 0,
+      translatedFileUrl: raw.translatedFileUrl,
+      error: raw.errorMessage || raw.error || raw.message,
+    };
+  }
+
   // Translate document
   async translateDocument(request: TranslationRequest): Promise<TranslationResponse> {
   try {
@@ -51,35 +96,20 @@ class TranslationService {
     formData.append('targetLanguage', request.targetLanguage);
     formData.append('documentType', request.documentType);
 
-    // ✅ Use API key for authentication (not AuthService token)
-    const apiKey = import.meta.env.VITE_TRANSLATION_API_KEY || 'tr_api_1234567890abcdefghijklmnopqrstuvwxyz';
-
     console.log(`[TranslationService] Sending translation request to: ${API_URL}/api/process-translation`);
     console.log(`[TranslationService] File: ${request.file.name}, Size: ${request.file.size} bytes`);
 
+    // ✅ Use API key for authentication (not AuthService token)
     const response = await fetch(`${API_URL}/api/process-translation`, {
       method: 'POST',
-      headers: {
-        'X-API-Key': apiKey  // ✅ Changed to X-API-Key header as backend expects
-      },
+      headers: API_HEADERS,
       // ✅ Don't set Content-Type - browser will set it with boundary for FormData
       body: formData,
     });
 
     console.log(`[TranslationService] Response status: ${response.status}`);
 
-    // ✅ Check if response is JSON
-    const contentType = response.headers.get('content-type');
-    let data;
-    
-    if (contentType && contentType.includes('application/json')) {
-      data = await response.json();
-    } else {
-      // If not JSON, read as text for error message
-      const text = await response.text();
-      console.error('[TranslationService] Non-JSON response:', text);
-      throw new Error(`Server returned non-JSON response: ${text.substring(0, 200)}`);
-    }
+    const data = await this.parseJsonResponse(response);
 
     console.log('[TranslationService] Response data:', data);
 
@@ -90,33 +120,40 @@ class TranslationService {
     }
 
     // ✅ Backend returns: { jobId, status, progress, translatedFileUrl }
-    const result = data;
-    
-    return {
-      jobId: result.jobId,
-      status: result.status,
-      progress: result.progress || 0,
-      translatedFileUrl: result.translatedFileUrl,
-      error: data.error || data.message
-    };
+    return this.toTranslationResponse(data);
   } catch (error: any) {
     console.error('[TranslationService] Translation error:', error);
     throw new Error(error.message || 'Failed to submit translation request');
   }
 }
 
+  // Coalesces concurrent status requests for the same job so simultaneous
+  // callers (poll loop, a manual refresh) share one round-trip
+  private inflightStatus = new Map<string, Promise<TranslationResponse>>();
+
   // Get translation status
   async getTranslationStatus(jobId: string): Promise<TranslationResponse> {
+    const pending = this.inflightStatus.get(jobId);
+    if (pending) {
+      return pending;
+    }
+
+    const request = this.fetchTranslationStatus(jobId).finally(() => {
+      this.inflightStatus.delete(jobId);
+    });
+    this.inflightStatus.set(jobId, request);
+    return request;
+  }
+
+  private async fetchTranslationStatus(jobId: string): Promise<TranslationResponse> {
     try {
       // Use the external API endpoint for job status
       const response = await fetch(`${API_URL}/api/jobs/${jobId}`, {
         method: 'GET',
-        headers: {
-          'X-API-Key': import.meta.env.VITE_TRANSLATION_API_KEY || 'tr_api_1234567890abcdefghijklmnopqrstuvwxyz'
-        },
+        headers: API_HEADERS,
       });
 
-      const data = await response.json();
+      const data = await this.parseJsonResponse(response);
 
       if (!response.ok) {
         throw new Error(data.message || 'Failed to fetch job status');
@@ -125,46 +162,59 @@ class TranslationService {
       // Align with external API response format
       // Backend returns: { success: true, data: { job: { ... } } }
       const job = data.data?.job || {};
-      
-      return {
-        jobId: job.id || jobId,
-        status: job.status,
-        progress: job.progress || 0,
-        translatedFileUrl: job.translatedFileUrl,
-        error: job.errorMessage || job.error,
-      };
+
+      return this.toTranslationResponse(job, jobId);
     } catch (error: any) {
       throw new Error(error.message || 'Failed to check translation status');
     }
   }
 
+  // Read the persisted history entry if it matches this page of results
+  private readHistoryCache(limit: number, offset: number): HistoryCacheEntry | null {
+    try {
+      const raw = localStorage.getItem(HISTORY_CACHE_KEY);
+      if (!raw) return null;
+      const entry: HistoryCacheEntry = JSON.parse(raw);
+      if (entry.limit !== limit || entry.offset !== offset) return null;
+      return entry;
+    } catch {
+      return null;
+    }
+  }
+
+  // Persist the latest history response (best effort - storage may be full)
+  private writeHistoryCache(limit: number, offset: number, jobs: TranslationJob[]): void {
+    try {
+      const entry: HistoryCacheEntry = { timestamp: Date.now(), limit, offset, jobs };
+      localStorage.setItem(HISTORY_CACHE_KEY, JSON.stringify(entry));
+    } catch {
+      // Ignore - caching is an optimization, not a requirement
+    }
+  }
+
   // Get translation history
   async getTranslationHistory(limit: number = 50, offset: number = 0): Promise<TranslationJob[]> {
+    // Serve a recent cached page without a round-trip; re-running the same
+    // view within the TTL costs nothing
+    const cached = this.readHistoryCache(limit, offset);
+    if (cached && Date.now() - cached.timestamp < HISTORY_CACHE_TTL_MS) {
+      console.log(`[TranslationService] Returning ${cached.jobs.length} jobs from history cache`);
+      return cached.jobs;
+    }
+
     try {
       console.log(`[TranslationService] Fetching translation history from: ${API_URL}/api/jobs`);
       
       // Use the external API endpoint for translation history
       const response = await fetch(`${API_URL}/api/jobs?limit=${limit}&offset=${offset}`, {
         method: 'GET',
-        headers: {
-          'X-API-Key': import.meta.env.VITE_TRANSLATION_API_KEY || 'tr_api_1234567890abcdefghijklmnopqrstuvwxyz'
-        },
+        headers: API_HEADERS,
       });
 
       console.log(`[TranslationService] Response status: ${response.status}`);
 
-      // Handle non-JSON responses
-      const contentType = response.headers.get('content-type');
-      let data;
-      
-      if (contentType && contentType.includes('application/json')) {
-        data = await response.json();
-      } else {
-        const text = await response.text();
-        console.error('[TranslationService] Non-JSON response:', text);
-        throw new Error(`Server returned ${response.status}: ${text.substring(0, 200)}`);
-      }
-      
+      const data = await this.parseJsonResponse(response);
+
       console.log('[TranslationService] Response data:', data);
 
       if (!response.ok) {
@@ -183,7 +233,7 @@ class TranslationService {
       console.log(`[TranslationService] Found ${jobs.length} jobs`);
       
       // Map backend API response to TranslationJob interface
-      return jobs.map((job: any) => ({
+      const mapped: TranslationJob[] = jobs.map((job: any) => ({
         id: job.id || job.jobId, // Handle both id and jobId
         sourceLanguage: job.sourceLanguage,
         targetLanguage: job.targetLanguage,
@@ -196,8 +246,16 @@ class TranslationService {
         completedAt: job.completedAt,
         translatedFileUrl: job.translatedFileUrl,
       }));
+
+      this.writeHistoryCache(limit, offset, mapped);
+      return mapped;
     } catch (error: any) {
       console.error('[TranslationService] Error fetching translation history:', error);
+      // Fall back to the stale cache rather than showing an empty history
+      if (cached) {
+        console.log(`[TranslationService] Falling back to ${cached.jobs.length} cached jobs after fetch error`);
+        return cached.jobs;
+      }
       throw new Error(error.message || 'Failed to fetch translation history');
     }
   }
@@ -215,9 +273,7 @@ class TranslationService {
     // ✅ Use the fullUrl
     const response = await fetch(fullUrl, {
       method: 'GET',
-      headers: {
-          'X-API-Key': import.meta.env.VITE_TRANSLATION_API_KEY || 'tr_api_1234567890abcdefghijklmnopqrstuvwxyz'
-      },
+      headers: API_HEADERS,
     });
 
     if (!response.ok) {
@@ -232,10 +288,10 @@ class TranslationService {
     let downloadFilename = filename || 'translated_document';
     const contentDisposition = response.headers.get('Content-Disposition');
     if (contentDisposition) {
-      const filenameMatch = contentDisposition.match(/filename[^;=\n]*=((['"]).*?\2|[^;\n]*)/);
+      const filenameMatch = contentDisposition.match(CONTENT_DISPOSITION_FILENAME_RE);
       if (filenameMatch && filenameMatch[1]) {
-        // Remove quotes if present
-        downloadFilename = filenameMatch[1].replace(/['"]/g, '');
+        // Trim surrounding quotes only; quotes inside the name are legitimate
+        downloadFilename = filenameMatch[1].replace(FILENAME_QUOTE_TRIM_RE, '');
         console.log(`[Frontend] Extracted filename from header: ${downloadFilename}`);
       }
     }
@@ -267,28 +323,22 @@ class TranslationService {
     maxAttempts: number = 60,
     intervalMs: number = 2000
   ): Promise<TranslationResponse> {
-    let attempts = 0;
-
-    return new Promise((resolve, reject) => {
-      const interval = setInterval(async () => {
-        try {
-          attempts++;
-          const status = await this.getTranslationStatus(jobId);
-          onUpdate(status);
-
-          if (status.status === 'completed' || status.status === 'failed') {
-            clearInterval(interval);
-            resolve(status);
-          } else if (attempts >= maxAttempts) {
-            clearInterval(interval);
-            reject(new Error('Translation timeout: Job took too long to complete'));
-          }
-        } catch (error) {
-          clearInterval(interval);
-          reject(error);
-        }
-      }, intervalMs);
-    });
+    // Schedule the next request only after the current one finishes so at most
+    // one status request is ever in flight. A fixed setInterval keeps firing
+    // while a slow response is pending, stacking overlapping requests against
+    // the backend's rate limit without getting fresher data.
+    for (let attempts = 1; attempts <= maxAttempts; attempts++) {
+      const status = await this.getTranslationStatus(jobId);
+      onUpdate(status);
+
+      if (status.status === 'completed' || status.status === 'failed') {
+        return status;
+      }
+
+      await new Promise(resolve => setTimeout(resolve, intervalMs));
+    }
+
+    throw new Error('Translation timeout: Job took too long to complete');
   }
 }
 
@@ -0,0 +1,21 @@
+// Shared password strength rules for the auth services.
+// One data-driven table instead of the same five if/test branches repeated
+// per service; rules are compiled once at module load.
+const PASSWORD_RULES: Array<{ test: (password: string) => boolean; error: string }> = [
+  { test: p => p.length >= 8, error: 'Password must be at least 8 characters long' },
+  { test: p => /[A-Z]/.test(p), error: 'Password must contain at least one uppercase letter' },
+  { test: p => /[a-z]/.test(p), error: 'Password must contain at least one lowercase letter' },
+  { test: p => /\d/.test(p), error: 'Password must contain at least one number' },
+  { test: p => /[!@#$%^&*(),.?":{}|<>]/.test(p), error: 'Password must contain at least one special character' },
+];
+
+export function validatePassword(password: string): { isValid: boolean; errors: string[] } {
+  const errors = PASSWORD_RULES
+    .filter(rule => !rule.test(password))
+    .map(rule => rule.error);
+
+  return {
+    isValid: errors.length === 0,
+    errors
+  };
+}